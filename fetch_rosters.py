@@ -1,5 +1,20 @@
-import requests
+import asyncio
+import functools
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import requests
+
+# aiohttp is optional; without it we still parallelize on a thread pool
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Team abbreviations for the Thanksgiving weekend 2025 games
 THANKSGIVING_TEAMS = {
@@ -25,104 +40,264 @@ ESPN_TEAM_IDS = {
     'PHI': 21
 }
 
+ROSTER_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/teams/{team_id}/roster"
+
+# Shared session so repeated calls reuse one pooled connection to ESPN
+# instead of paying a fresh TCP+TLS handshake per team
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+))
+
+def _write_json_atomic(path, obj, **dump_kwargs):
+    """Write JSON via a temp file + rename so a crash can't leave a torn file"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(obj, f, **dump_kwargs)
+    os.replace(tmp_path, path)
+
+# Rosters barely change within a day, so cache parsed rosters on disk
+# keyed by team+date and skip the network entirely on warm runs
+CACHE_DIR = '.cache'
+
+def _cache_path(team_abbr):
+    return os.path.join(CACHE_DIR, f"roster_{team_abbr}_{date.today().isoformat()}.json")
+
+def _cache_get(team_abbr):
+    """Return today's cached players for a team, or None"""
+    path = _cache_path(team_abbr)
+    if os.path.exists(path):
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Ignoring bad cache file for {team_abbr}: {e}")
+    return None
+
+def _cache_put(team_abbr, players):
+    """Store parsed players for a team under today's date"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Machine-read only, so skip pretty-printing
+    _write_json_atomic(_cache_path(team_abbr), players, separators=(',', ':'))
+
+# ESPN sends ETag/Last-Modified headers, and rosters change on the order
+# of days - so when the day cache misses we revalidate with a conditional
+# GET and a 304 costs only headers instead of the full roster body
+ETAG_CACHE_FILE = os.path.join(CACHE_DIR, 'roster_etags.json')
+_etag_lock = threading.Lock()
+
+def _load_etag_cache():
+    if os.path.exists(ETAG_CACHE_FILE):
+        try:
+            with open(ETAG_CACHE_FILE, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Ignoring bad etag cache: {e}")
+    return {}
+
+def _save_etag_cache(cache):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _write_json_atomic(ETAG_CACHE_FILE, cache, separators=(',', ':'))
+
+def _conditional_headers(entry):
+    """Build If-None-Match / If-Modified-Since headers from a cache entry"""
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+def _etag_entry(headers, players):
+    return {
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+        'players': players
+    }
+
+def parse_roster(team_abbr, data):
+    """Extract player info from a decoded ESPN roster response"""
+    players = []
+
+    # Process athletes from roster
+    for group in data.get('athletes', []):
+        for athlete in group.get('items', []):
+            player_info = {
+                'name': athlete.get('displayName', ''),
+                'full_name': athlete.get('fullName', ''),
+                'jersey': athlete.get('jersey', ''),
+                'position': athlete.get('position', {}).get('abbreviation', ''),
+                'headshot': athlete.get('headshot', {}).get('href', ''),
+                'team': team_abbr,
+                'team_name': THANKSGIVING_TEAMS[team_abbr]
+            }
+            players.append(player_info)
+
+    return players
+
+@functools.lru_cache(maxsize=None)
 def fetch_team_roster(team_abbr):
     """Fetch roster for a specific team from ESPN API"""
     team_id = ESPN_TEAM_IDS.get(team_abbr)
     if not team_id:
         return None
-    
-    url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/teams/{team_id}/roster"
-    
+
+    cached = _cache_get(team_abbr)
+    if cached is not None:
+        return cached
+
+    url = ROSTER_URL.format(team_id=team_id)
+
     try:
-        response = requests.get(url, timeout=10)
+        with _etag_lock:
+            entry = _load_etag_cache().get(team_abbr, {})
+
+        response = _session.get(url, timeout=10, headers=_conditional_headers(entry))
+
+        if response.status_code == 304 and entry.get('players') is not None:
+            _cache_put(team_abbr, entry['players'])
+            return entry['players']
+
         response.raise_for_status()
-        data = response.json()
-        
-        players = []
-        
-        # Process athletes from roster
-        for group in data.get('athletes', []):
-            position_group = group.get('position', 'Unknown')
-            for athlete in group.get('items', []):
-                player_info = {
-                    'name': athlete.get('displayName', ''),
-                    'full_name': athlete.get('fullName', ''),
-                    'jersey': athlete.get('jersey', ''),
-                    'position': athlete.get('position', {}).get('abbreviation', ''),
-                    'headshot': athlete.get('headshot', {}).get('href', ''),
-                    'team': team_abbr,
-                    'team_name': THANKSGIVING_TEAMS[team_abbr]
-                }
-                players.append(player_info)
-        
+        players = parse_roster(team_abbr, response.json())
+        _cache_put(team_abbr, players)
+
+        with _etag_lock:
+            etags = _load_etag_cache()
+            etags[team_abbr] = _etag_entry(response.headers, players)
+            _save_etag_cache(etags)
+
         return players
-    
+
     except Exception as e:
         print(f"Error fetching roster for {team_abbr}: {e}")
         return None
 
+async def _fetch_roster(session, team_abbr, etag_entry):
+    """Fetch and parse one roster on a shared aiohttp session
+
+    Returns (team_abbr, players, new_etag_entry); the entry is None when
+    the etag cache needs no update.
+    """
+    team_id = ESPN_TEAM_IDS.get(team_abbr)
+    if not team_id:
+        return team_abbr, None, None
+
+    cached = _cache_get(team_abbr)
+    if cached is not None:
+        return team_abbr, cached, None
+
+    url = ROSTER_URL.format(team_id=team_id)
+
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10),
+                               headers=_conditional_headers(etag_entry)) as response:
+            if response.status == 304 and etag_entry.get('players') is not None:
+                _cache_put(team_abbr, etag_entry['players'])
+                return team_abbr, etag_entry['players'], None
+            response.raise_for_status()
+            data = await response.json()
+            headers = response.headers
+        players = parse_roster(team_abbr, data)
+        _cache_put(team_abbr, players)
+        return team_abbr, players, _etag_entry(headers, players)
+
+    except Exception as e:
+        print(f"Error fetching roster for {team_abbr}: {e}")
+        return team_abbr, None, None
+
+async def _fetch_all_rosters():
+    """Fetch all team rosters concurrently, logging each as it finishes"""
+    results = {}
+    etags = _load_etag_cache()
+    async with aiohttp.ClientSession() as session:
+        tasks = [_fetch_roster(session, team_abbr, etags.get(team_abbr, {}))
+                 for team_abbr in THANKSGIVING_TEAMS]
+        for task in asyncio.as_completed(tasks):
+            team_abbr, roster, new_entry = await task
+            if roster:
+                print(f"  ✅ {THANKSGIVING_TEAMS[team_abbr]}: {len(roster)} players")
+            else:
+                print(f"  ❌ Failed to fetch {THANKSGIVING_TEAMS[team_abbr]}")
+            results[team_abbr] = roster
+            if new_entry:
+                etags[team_abbr] = new_entry
+    _save_etag_cache(etags)
+    return results
+
+def _fetch_all_rosters_threaded():
+    """Stdlib fallback: run the blocking fetches concurrently on a thread pool
+
+    requests releases the GIL during socket I/O and the shared session is
+    thread-safe for GETs, so threads parallelize this just as well.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(THANKSGIVING_TEAMS)) as executor:
+        rosters = executor.map(fetch_team_roster, THANKSGIVING_TEAMS)
+    for team_abbr, roster in zip(THANKSGIVING_TEAMS, rosters):
+        if roster:
+            print(f"  ✅ {THANKSGIVING_TEAMS[team_abbr]}: {len(roster)} players")
+        else:
+            print(f"  ❌ Failed to fetch {THANKSGIVING_TEAMS[team_abbr]}")
+        results[team_abbr] = roster
+    return results
+
 def fetch_all_rosters():
     """Fetch rosters for all Thanksgiving weekend teams"""
-    all_players = []
-    
     print("Fetching rosters for Thanksgiving weekend games...")
     print("=" * 60)
-    
-    for team_abbr in THANKSGIVING_TEAMS.keys():
-        print(f"Fetching {THANKSGIVING_TEAMS[team_abbr]}...")
-        roster = fetch_team_roster(team_abbr)
+
+    if aiohttp is not None:
+        results = asyncio.run(_fetch_all_rosters())
+    else:
+        results = _fetch_all_rosters_threaded()
+
+    # Keep a stable team order in the output file
+    all_players = []
+    for team_abbr in THANKSGIVING_TEAMS:
+        roster = results.get(team_abbr)
         if roster:
             all_players.extend(roster)
-            print(f"  ✅ Found {len(roster)} players")
-        else:
-            print(f"  ❌ Failed to fetch roster")
-    
+
     print("=" * 60)
     print(f"Total players: {len(all_players)}")
-    
+
     return all_players
 
 def save_rosters_to_json(players, filename='thanksgiving_rosters.json'):
     """Save roster data to JSON file"""
-    with open(filename, 'w') as f:
-        json.dump(players, f, indent=2)
+    _write_json_atomic(filename, players, indent=2)
     print(f"\n✅ Saved roster data to {filename}")
 
 def create_player_lookup(players):
     """Create a searchable player lookup dictionary"""
     lookup = {}
     for player in players:
-        # Create multiple keys for flexible searching
-        name_lower = player['name'].lower()
-        full_name_lower = player['full_name'].lower()
-        
-        key = f"{name_lower}|{player['team'].lower()}"
-        lookup[key] = player
-        
-        # Also add full name variant
-        full_key = f"{full_name_lower}|{player['team'].lower()}"
-        lookup[full_key] = player
-    
+        # Lowercase the team once; the display-name and full-name keys share it
+        team_lower = player['team'].lower()
+        lookup[f"{player['name'].lower()}|{team_lower}"] = player
+        lookup[f"{player['full_name'].lower()}|{team_lower}"] = player
+
     return lookup
 
 if __name__ == "__main__":
     # Fetch all rosters
     players = fetch_all_rosters()
-    
+
     # Save to JSON
     save_rosters_to_json(players)
-    
+
     # Create lookup dictionary and save
     lookup = create_player_lookup(players)
-    with open('player_lookup.json', 'w') as f:
-        json.dump(lookup, f, indent=2)
+    _write_json_atomic('player_lookup.json', lookup, separators=(',', ':'))
     print(f"✅ Saved player lookup to player_lookup.json")
-    
+
     # Print some sample players with photos
     print("\n" + "=" * 60)
     print("Sample players with photos:")
     print("=" * 60)
-    
+
     count = 0
     for player in players:
         if player['headshot'] and count < 10:
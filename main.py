@@ -1,7 +1,16 @@
+import asyncio
+import bisect
 import discord
+import heapq
+import itertools
 from discord.ext import commands
 import json
+import orjson
 import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
 
 # Bot setup
@@ -11,7 +20,7 @@ intents.reactions = True
 bot = commands.Bot(command_prefix='!', intents=intents)
 
 # Data storage
-DRAFT_DATA_FILE = 'draft_data.json'
+DRAFT_DB_FILE = 'draft.db'
 ROSTER_FILE = 'thanksgiving_rosters.json'
 
 # Valid teams for Thanksgiving weekend 2025
@@ -31,201 +40,439 @@ TEAM_NAMES = {
 # Emoji numbers for selection
 NUMBER_EMOJIS = ['1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣', '🔟']
 
+# Emoji -> board index, so reaction handling is one dict lookup instead
+# of a list scan plus .index()
+NUMBER_EMOJI_INDEX = {emoji: i for i, emoji in enumerate(NUMBER_EMOJIS)}
+
 # Position emojis for navigation
 POSITION_EMOJIS = {
     '🏈': 'QB',
-    '🏃': 'RB', 
+    '🏃': 'RB',
     '🙌': 'WR',
     '🤲': 'TE'
 }
 
+# Draftable positions in display order
+POSITIONS = ('QB', 'RB', 'WR', 'TE')
+
+# Built once; every board shows the same navigation row
+POSITION_NAV = " | ".join(f"{emoji} {pos}" for emoji, pos in POSITION_EMOJIS.items())
+
+def player_key(name, team):
+    """Canonical key for a drafted player, normalized once at ingest
+
+    A tuple avoids the per-check f-string join, and casefold handles
+    any non-ASCII names correctly.
+    """
+    return (name.casefold(), team.casefold())
+
+@dataclass(frozen=True, slots=True)
+class Player:
+    """Immutable roster entry
+
+    Frozen so no caller can mutate shared roster state, and slotted so
+    attribute reads in the hot board/merge loops skip the per-instance
+    dict lookup.
+    """
+    name: str
+    team: str
+    position: str
+    headshot: str
+    fantasy_rank: int
+    key: tuple
+
 class RosterManager:
     def __init__(self):
         self.players = []
         self.players_by_position = {}
+        self.available_by_position = {}
+        self.name_keys = []
+        self.name_players = []
+        self.top_cache = {}
         self.load_rosters()
     
     def load_rosters(self):
         """Load roster data from JSON file"""
         if os.path.exists(ROSTER_FILE):
             try:
-                with open(ROSTER_FILE, 'r') as f:
-                    self.players = json.load(f)
-                
-                # Organize by position
+                # orjson parses the few-hundred-KB roster file 2-3x
+                # faster than stdlib json
+                with open(ROSTER_FILE, 'rb') as f:
+                    raw_players = orjson.loads(f.read())
+
+                # Freeze each record into an immutable Player with its
+                # canonical key stamped once, then organize by position
+                self.players = [
+                    Player(
+                        name=raw.get('name', ''),
+                        team=raw.get('team', ''),
+                        position=raw.get('position', ''),
+                        headshot=raw.get('headshot', ''),
+                        fantasy_rank=raw.get('fantasy_rank', 999),
+                        key=player_key(raw.get('name', ''), raw.get('team', ''))
+                    )
+                    for raw in raw_players
+                ]
                 for player in self.players:
-                    pos = player['position']
+                    pos = player.position
                     if pos not in self.players_by_position:
                         self.players_by_position[pos] = []
                     self.players_by_position[pos].append(player)
-                
+
+                # Sort each position by fantasy rank once at load so no
+                # per-render sort is ever needed
+                for pos_players in self.players_by_position.values():
+                    pos_players.sort(key=lambda p: p.fantasy_rank)
+                self.reset_availability()
+
+                # Sorted name index so typed-name lookups are a binary
+                # search instead of a scan over every player
+                by_name = sorted(self.players, key=lambda p: p.name.lower())
+                self.name_keys = [p.name.lower() for p in by_name]
+                self.name_players = by_name
+
                 print(f"✅ Loaded {len(self.players)} players from rosters")
             except Exception as e:
                 print(f"⚠️ Could not load roster file: {e}")
         else:
             print(f"⚠️ Roster file not found: {ROSTER_FILE}")
     
-    def get_top_available(self, position, drafted_players, limit=10):
-        """Get top available players at a position, sorted by fantasy rank"""
-        available = []
+    def reset_availability(self):
+        """Mark every player available (new draft)"""
+        self.available_by_position = {pos: list(players)
+                                      for pos, players in self.players_by_position.items()}
+
+    def mark_drafted(self, player_name, player_team, position):
+        """Remove a drafted player from their position's availability list"""
+        key = player_key(player_name, player_team)
+        available = self.available_by_position.get(position, [])
+        for i, player in enumerate(available):
+            if player.key == key:
+                del available[i]
+                return
+
+    def mark_undrafted(self, player_name, player_team, position):
+        """Re-insert an undone pick into the availability list at its rank"""
+        key = player_key(player_name, player_team)
         for player in self.players_by_position.get(position, []):
-            player_key = f"{player['name'].lower()}|{player['team'].lower()}"
-            if player_key not in drafted_players:
-                available.append(player)
-        
-        # Sort by fantasy_rank (lower is better)
-        available.sort(key=lambda x: x.get('fantasy_rank', 999))
-        
-        return available[:limit]
+            if player.key == key:
+                available = self.available_by_position.setdefault(position, [])
+                rank = player.fantasy_rank
+                i = 0
+                while i < len(available) and available[i].fantasy_rank <= rank:
+                    i += 1
+                available.insert(i, player)
+                return
+
+    def find_players(self, query):
+        """Find players whose name starts with the query (case-insensitive)"""
+        prefix = query.lower()
+        matches = []
+        i = bisect.bisect_left(self.name_keys, prefix)
+        while i < len(self.name_keys) and self.name_keys[i].startswith(prefix):
+            matches.append(self.name_players[i])
+            i += 1
+        return matches
+
+    def get_top_available(self, position, limit=10, version=0):
+        """Get top available players at a position, sorted by fantasy rank
+
+        Memoized per (position, version, limit); the draft bumps its
+        version on every pick/undo, so reactions that don't change the
+        board reuse the cached list instead of rescanning the position.
+        The availability lists are maintained incrementally and already
+        rank-sorted, so even a miss is just a slice.
+        """
+        cache_key = (position, version, limit)
+        cached = self.top_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self.available_by_position.get(position, [])[:limit]
+        self.top_cache[cache_key] = result
+        return result
 
 roster_manager = RosterManager()
 
 class DraftManager:
     def __init__(self):
+        # SQLite in autocommit mode so each pick is one small append
+        # instead of rewriting the whole draft state per pick
+        self.db = sqlite3.connect(DRAFT_DB_FILE, isolation_level=None, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db_lock = threading.Lock()
+        self.create_tables()
         self.base_draft_order = []
-        self.draft_order = []
+        self.pick_meta = []
+        # Invariant after start_draft; cached so hot paths skip the len() call
+        self.n_picks = 0
         self.current_pick = 0
         self.num_rounds = 0
         self.teams = {}
         self.all_picks = []
+        # pick_number -> pick_data; not persisted, rebuilt from the pick log
+        self.picks_by_number = {}
         self.is_active = False
         self.channel_id = None
-        self.drafted_players = set()
+        # key -> pick_data, so membership and who-drafted-them are both O(1)
+        self.drafted_players = {}
+        self.rendered_rosters = {}
+        # Bumped on every pick/undo; keys RosterManager's top-N cache
+        self.cache_version = 0
         self.current_draft_message = None
+        # How many number reactions the current board carries
+        self.board_reaction_count = 0
+        # Snapshot of the players shown on the current board, so a number
+        # reaction resolves by index without recomputing the top-N list
+        self.current_board_players = []
         self.current_position = 'QB'
         self.load_data()
     
-    def start_draft(self, draft_order, num_rounds, channel_id):
+    def create_tables(self):
+        self.db.executescript('''
+            CREATE TABLE IF NOT EXISTS picks (
+                pick_number INTEGER PRIMARY KEY,
+                user_id TEXT,
+                player_name TEXT,
+                player_team TEXT,
+                position TEXT,
+                round INTEGER,
+                ts INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS teams (
+                user_id TEXT PRIMARY KEY,
+                team_name TEXT
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        ''')
+
+    def db_execute(self, sql, params=()):
+        with self.db_lock:
+            self.db.execute(sql, params)
+
+    async def db_execute_async(self, sql, params=()):
+        """Run a write in a thread so disk I/O never blocks the event loop"""
+        await asyncio.to_thread(self.db_execute, sql, params)
+
+    async def start_draft(self, draft_order, num_rounds, channel_id):
         self.base_draft_order = draft_order
         self.num_rounds = num_rounds
         self.channel_id = channel_id
         self.is_active = True
         self.current_pick = 0
         self.all_picks = []
-        self.drafted_players = set()
+        self.picks_by_number = {}
+        self.drafted_players = {}
+        self.rendered_rosters = {}
+        self.cache_version += 1
+        roster_manager.reset_availability()
         self.current_position = 'QB'
         
-        # Create snake draft order
-        self.draft_order = self.create_snake_order()
-        
+        # The snake order lives entirely in pick_meta
+        self.pick_meta = self.build_pick_meta()
+        self.n_picks = len(self.pick_meta)
+
         # Initialize teams
-        self.teams = {user_id: {'players': [], 'team_name': f'Team {i+1}'} 
+        self.teams = {user_id: {'players': [], 'team_name': f'Team {i+1}'}
                      for i, user_id in enumerate(draft_order)}
-        
-        self.save_data()
-    
-    def create_snake_order(self):
-        """Create snake draft order (1-2-3, 3-2-1, 1-2-3, etc.)"""
-        order = []
-        for round_num in range(self.num_rounds):
-            if round_num % 2 == 0:
-                order.extend(self.base_draft_order)
-            else:
-                order.extend(reversed(self.base_draft_order))
-        return order
+
+        await asyncio.to_thread(self.reset_draft_tables)
     
-    def get_current_user(self):
-        if self.current_pick < len(self.draft_order):
-            return self.draft_order[self.current_pick]
+    def build_pick_meta(self):
+        """Precompute (round, pick_in_round, user_id) for every pick slot
+
+        All per-pick round/slot arithmetic is knowable at draft start, so
+        compute it once and make every lookup a plain index.
+        """
+        return [
+            (round_num + 1, slot + 1, user_id)
+            for round_num in range(self.num_rounds)
+            for slot, user_id in enumerate(
+                self.base_draft_order if round_num % 2 == 0
+                else reversed(self.base_draft_order)
+            )
+        ]
+
+    def get_pick_slot(self, pick_index=None):
+        """Get (round, pick_in_round, user_id) for a pick slot, or None when out of range"""
+        if pick_index is None:
+            pick_index = self.current_pick
+        if 0 <= pick_index < self.n_picks:
+            return self.pick_meta[pick_index]
         return None
-    
+
+    def get_current_user(self):
+        slot = self.get_pick_slot()
+        return slot[2] if slot else None
+
     def get_next_user(self):
-        if self.current_pick + 1 < len(self.draft_order):
-            return self.draft_order[self.current_pick + 1]
-        return None
-    
+        slot = self.get_pick_slot(self.current_pick + 1)
+        return slot[2] if slot else None
+
     def get_current_round(self):
-        return (self.current_pick // len(self.base_draft_order)) + 1
-    
+        slot = self.get_pick_slot()
+        return slot[0] if slot else self.num_rounds
+    
+    def append_roster_line(self, user_id, pick_data):
+        """Extend a team's cached roster text with its newest pick"""
+        line = (f"{len(self.teams[user_id]['players'])}. {pick_data['player_name']} "
+                f"({pick_data['position']} - {pick_data['player_team']})")
+        cached = self.rendered_rosters.get(user_id)
+        self.rendered_rosters[user_id] = f"{cached}\n{line}" if cached else line
+
+    def get_roster_text(self, user_id):
+        return self.rendered_rosters.get(user_id) or "No picks yet"
+
     def is_player_drafted(self, player_name, team_abbr):
-        key = f"{player_name.lower()}|{team_abbr.lower()}"
-        return key in self.drafted_players
-    
-    def add_pick(self, player_name, player_team, position):
-        if self.current_pick >= len(self.draft_order):
+        return player_key(player_name, team_abbr) in self.drafted_players
+    
+    def reset_draft_tables(self):
+        """Fresh draft wipes any previous one"""
+        with self.db_lock:
+            self.db.execute('DELETE FROM picks')
+            self.db.execute('DELETE FROM teams')
+            self.db.executemany(
+                'INSERT INTO teams (user_id, team_name) VALUES (?, ?)',
+                [(user_id, team['team_name']) for user_id, team in self.teams.items()]
+            )
+        self.save_meta()
+
+    async def add_pick(self, player_name, player_team, position):
+        if self.current_pick >= self.n_picks:
             return None, "Draft is complete!"
         
-        # Create player key
-        player_key = f"{player_name.lower()}|{player_team.lower()}"
-        
+        # Compute the key once and reuse it for the dup check and insert
+        key = player_key(player_name, player_team)
+
         # Check if already drafted
-        if player_key in self.drafted_players:
+        if key in self.drafted_players:
             return None, f"{player_name} ({player_team}) has already been drafted!"
         
-        user_id = self.draft_order[self.current_pick]
+        user_id = self.pick_meta[self.current_pick][2]
         
         pick_data = {
             'player_name': player_name,
             'player_team': player_team,
             'position': position,
             'pick_number': len(self.all_picks) + 1,
-            'round': self.get_current_round()
+            'round': self.get_current_round(),
+            # Nanosecond int: one syscall, no string formatting on the hot path
+            'ts_ns': time.time_ns()
         }
-        
+
         self.teams[user_id]['players'].append(pick_data)
         self.all_picks.append({
             'user_id': user_id,
             **pick_data
         })
-        
-        self.drafted_players.add(player_key)
+        self.picks_by_number[pick_data['pick_number']] = pick_data
+        self.append_roster_line(user_id, pick_data)
+
+        self.drafted_players[key] = pick_data
+        roster_manager.mark_drafted(player_name, player_team, position)
         self.current_pick += 1
-        self.save_data()
-        
+        self.cache_version += 1
+
+        # One incremental insert instead of a full-state rewrite
+        await self.db_execute_async(
+            'INSERT INTO picks (pick_number, user_id, player_name, player_team, position, round, ts) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (pick_data['pick_number'], user_id, player_name, player_team,
+             position, pick_data['round'], pick_data['ts_ns'])
+        )
+
         return user_id, None
     
-    def undo_last_pick(self):
+    async def undo_last_pick(self):
         if not self.all_picks:
             return False
         
         last_pick = self.all_picks.pop()
         user_id = last_pick['user_id']
         
-        # Remove from team
-        self.teams[user_id]['players'] = [
-            p for p in self.teams[user_id]['players'] 
-            if p['pick_number'] != last_pick['pick_number']
-        ]
-        
-        # Remove from drafted set
-        player_key = f"{last_pick['player_name'].lower()}|{last_pick['player_team'].lower()}"
-        self.drafted_players.discard(player_key)
+        # The undone pick is always the newest entry on that team's list,
+        # so pop it instead of rebuilding the list
+        popped = self.teams[user_id]['players'].pop()
+        assert popped['pick_number'] == last_pick['pick_number']
+        self.picks_by_number.pop(last_pick['pick_number'], None)
         
+        # Drop the last line from the cached roster text
+        cached = self.rendered_rosters.get(user_id, '')
+        self.rendered_rosters[user_id] = cached.rsplit('\n', 1)[0] if '\n' in cached else ''
+
+        # Remove from drafted map
+        self.drafted_players.pop(player_key(last_pick['player_name'], last_pick['player_team']), None)
+        roster_manager.mark_undrafted(last_pick['player_name'], last_pick['player_team'], last_pick['position'])
+
         self.current_pick -= 1
-        self.save_data()
+        self.cache_version += 1
+        await self.db_execute_async('DELETE FROM picks WHERE pick_number = ?', (last_pick['pick_number'],))
         return True
     
-    def save_data(self):
-        data = {
-            'base_draft_order': self.base_draft_order,
-            'draft_order': self.draft_order,
-            'current_pick': self.current_pick,
-            'num_rounds': self.num_rounds,
-            'teams': self.teams,
-            'all_picks': self.all_picks,
-            'is_active': self.is_active,
-            'channel_id': self.channel_id,
-            'drafted_players': list(self.drafted_players)
-        }
-        with open(DRAFT_DATA_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
-    
+    def save_meta(self):
+        """Persist draft settings; picks and teams are written incrementally"""
+        with self.db_lock:
+            for key, value in (('base_draft_order', self.base_draft_order),
+                               ('num_rounds', self.num_rounds),
+                               ('is_active', self.is_active),
+                               ('channel_id', self.channel_id)):
+                self.db.execute(
+                    'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                    (key, json.dumps(value))
+                )
+
+    async def save_data(self):
+        await asyncio.to_thread(self.save_meta)
+
     def load_data(self):
-        if os.path.exists(DRAFT_DATA_FILE):
-            try:
-                with open(DRAFT_DATA_FILE, 'r') as f:
-                    data = json.load(f)
-                self.base_draft_order = data.get('base_draft_order', [])
-                self.draft_order = data.get('draft_order', [])
-                self.current_pick = data.get('current_pick', 0)
-                self.num_rounds = data.get('num_rounds', 0)
-                self.teams = data.get('teams', {})
-                self.all_picks = data.get('all_picks', [])
-                self.is_active = data.get('is_active', False)
-                self.channel_id = data.get('channel_id')
-                self.drafted_players = set(data.get('drafted_players', []))
-            except Exception as e:
-                print(f"Error loading draft data: {e}")
+        try:
+            meta = {key: json.loads(value)
+                    for key, value in self.db.execute('SELECT key, value FROM meta')}
+            if not meta:
+                return
+
+            self.base_draft_order = meta.get('base_draft_order', [])
+            self.num_rounds = meta.get('num_rounds', 0)
+            self.is_active = meta.get('is_active', False)
+            self.channel_id = meta.get('channel_id')
+
+            self.teams = {user_id: {'players': [], 'team_name': team_name}
+                          for user_id, team_name in self.db.execute('SELECT user_id, team_name FROM teams')}
+
+            # Rebuild in-memory draft state from the pick log
+            rows = self.db.execute(
+                'SELECT pick_number, user_id, player_name, player_team, position, round, ts '
+                'FROM picks ORDER BY pick_number'
+            )
+            for pick_number, user_id, player_name, player_team, position, round_num, ts in rows:
+                pick_data = {
+                    'player_name': player_name,
+                    'player_team': player_team,
+                    'position': position,
+                    'pick_number': pick_number,
+                    'round': round_num,
+                    # int() guards rows from databases created when the
+                    # column still had TEXT affinity
+                    'ts_ns': int(ts)
+                }
+                self.teams[user_id]['players'].append(pick_data)
+                self.all_picks.append({
+                    'user_id': user_id,
+                    **pick_data
+                })
+                self.picks_by_number[pick_number] = pick_data
+                self.append_roster_line(user_id, pick_data)
+                self.drafted_players[player_key(player_name, player_team)] = pick_data
+                roster_manager.mark_drafted(player_name, player_team, position)
+
+            self.current_pick = len(self.all_picks)
+            self.pick_meta = self.build_pick_meta()
+            self.n_picks = len(self.pick_meta)
+        except Exception as e:
+            print(f"Error loading draft data: {e}")
 
 draft_manager = DraftManager()
 
@@ -237,15 +484,13 @@ async def on_ready():
 
 async def create_draft_board(ctx, position):
     """Create visual draft board with top 10 players"""
-    current_user_id = draft_manager.get_current_user()
-    current_round = draft_manager.get_current_round()
-    pick_in_round = ((draft_manager.current_pick) % len(draft_manager.base_draft_order)) + 1
+    current_round, pick_in_round, current_user_id = draft_manager.get_pick_slot()
     
     # Get top available players
     available_players = roster_manager.get_top_available(
-        position, 
-        draft_manager.drafted_players,
-        limit=10
+        position,
+        limit=10,
+        version=draft_manager.cache_version
     )
     
     if not available_players:
@@ -254,6 +499,7 @@ async def create_draft_board(ctx, position):
             description="All players at this position have been drafted. Try another position!",
             color=discord.Color.red()
         )
+        draft_manager.current_board_players = []
         return embed, []
     
     # Create embed
@@ -263,34 +509,98 @@ async def create_draft_board(ctx, position):
         color=discord.Color.blue()
     )
     
-    # Add players
-    for i, player in enumerate(available_players[:10]):
-        emoji = NUMBER_EMOJIS[i]
-        name = player['name']
-        team = player['team']
-        pos = player['position']
-        
-        embed.add_field(
-            name=f"{emoji} {name}",
-            value=f"{pos} - {team}",
-            inline=True
-        )
-        
-        # Add thumbnail for first player if available
-        if i == 0 and player.get('headshot'):
-            embed.set_thumbnail(url=player['headshot'])
+    # Add players as one joined block in the description - one string
+    # build instead of ten Field objects, and a smaller payload on the wire
+    embed.description += "\n\n" + "\n".join([
+        f"{NUMBER_EMOJIS[i]} **{player.name}** — {player.position} {player.team}"
+        for i, player in enumerate(available_players)
+    ])
+
+    # Add thumbnail for top player if available
+    if available_players[0].headshot:
+        embed.set_thumbnail(url=available_players[0].headshot)
     
     # Add position navigation
     embed.add_field(
         name="\n🔄 Switch Position",
-        value="🏈 QB | 🏃 RB | 🙌 WR | 🤲 TE",
+        value=POSITION_NAV,
         inline=False
     )
     
-    embed.set_footer(text=f"Pick #{draft_manager.current_pick + 1} of {len(draft_manager.draft_order)}")
-    
+    embed.set_footer(text=f"Pick #{draft_manager.current_pick + 1} of {draft_manager.n_picks}")
+
+    draft_manager.current_board_players = available_players
     return embed, available_players
 
+async def add_board_reactions(message, players):
+    """Add the number and position reactions to a board concurrently
+
+    One gather instead of up to 14 sequential awaits; discord.py's
+    ratelimit handler serializes as needed if Discord pushes back.
+    """
+    count = min(len(players), 10)
+    emojis = (*NUMBER_EMOJIS[:count], *POSITION_EMOJIS)
+    await asyncio.gather(*(message.add_reaction(emoji) for emoji in emojis))
+    draft_manager.board_reaction_count = count
+
+async def process_pick(channel, user, selected_player):
+    """Record a pick, announce it, and advance the draft board
+
+    Shared by the reaction board and the !pick command. Returns False if
+    the pick was rejected.
+    """
+    user_id, error = await draft_manager.add_pick(
+        selected_player.name,
+        selected_player.team,
+        selected_player.position
+    )
+
+    if error:
+        await channel.send(f"❌ {error}")
+        return False
+
+    # Announce the pick
+    pick_number = len(draft_manager.all_picks)
+    cur_pick = draft_manager.current_pick
+    # Use current_pick before increment to get the slot of the pick just made
+    current_round, pick_in_round, _ = draft_manager.get_pick_slot(cur_pick - 1)
+
+    embed = discord.Embed(
+        title=f"✅ Pick #{pick_number} (Round {current_round}, Pick {pick_in_round})",
+        description=f"<@{user.id}> selects:",
+        color=discord.Color.green()
+    )
+    embed.add_field(name="Player", value=selected_player.name, inline=True)
+    embed.add_field(name="Position", value=selected_player.position, inline=True)
+    embed.add_field(name="Team", value=selected_player.team, inline=True)
+
+    if selected_player.headshot:
+        embed.set_thumbnail(url=selected_player.headshot)
+
+    await channel.send(embed=embed)
+
+    # Check if draft is complete
+    if cur_pick >= draft_manager.n_picks:
+        await channel.send("🎉 **DRAFT COMPLETE!** Use `!teams` to see all rosters or `!export` to get data for scoring.")
+        draft_manager.is_active = False
+        await draft_manager.save_data()
+        return True
+
+    # Show next draft board; the on-the-clock ping rides along as message
+    # content so it's one send instead of two
+    draft_manager.current_position = 'QB'  # Reset to QB
+    embed, players = await create_draft_board(channel, 'QB')
+    next_round, next_pick_in_round, next_user_id = draft_manager.get_pick_slot()
+    new_message = await channel.send(
+        content=f"🔔 <@{next_user_id}> - You're on the clock! (Round {next_round}, Pick {next_pick_in_round})",
+        embed=embed
+    )
+
+    await add_board_reactions(new_message, players)
+
+    draft_manager.current_draft_message = new_message.id
+    return True
+
 @bot.command(name='startdraft')
 async def start_draft(ctx, rounds: int, *user_mentions):
     """Start a new visual draft"""
@@ -322,7 +632,7 @@ async def start_draft(ctx, rounds: int, *user_mentions):
         await ctx.send("❌ Need at least 2 users for a draft!")
         return
     
-    draft_manager.start_draft(draft_order, rounds, ctx.channel.id)
+    await draft_manager.start_draft(draft_order, rounds, ctx.channel.id)
     
     # Create initial announcement
     order_text = "\n".join([f"{i+1}. <@{uid}>" for i, uid in enumerate(draft_order)])
@@ -336,18 +646,15 @@ async def start_draft(ctx, rounds: int, *user_mentions):
     
     await ctx.send(embed=embed)
     
-    # Show first draft board
+    # Show first draft board with the first on-the-clock ping in one send
     embed, players = await create_draft_board(ctx, 'QB')
-    message = await ctx.send(embed=embed)
-    
-    # Add reaction options
-    for i in range(min(len(players), 10)):
-        await message.add_reaction(NUMBER_EMOJIS[i])
-    
-    # Add position navigation
-    for emoji in POSITION_EMOJIS.keys():
-        await message.add_reaction(emoji)
+    message = await ctx.send(
+        content=f"🔔 <@{draft_order[0]}> - You're on the clock first!",
+        embed=embed
+    )
     
+    await add_board_reactions(message, players)
+
     draft_manager.current_draft_message = message.id
 
 @bot.event
@@ -373,7 +680,9 @@ async def on_reaction_add(reaction, user):
     
     emoji = str(reaction.emoji)
     
-    # Handle position switching
+    # Handle position switching. This branch is view-only: it touches no
+    # persistent state, so it must never hit the database - only picks,
+    # undos, and draft start/end write anything.
     if emoji in POSITION_EMOJIS:
         draft_manager.current_position = POSITION_EMOJIS[emoji]
         
@@ -381,91 +690,69 @@ async def on_reaction_add(reaction, user):
         embed, players = await create_draft_board(reaction.message.channel, draft_manager.current_position)
         await reaction.message.edit(embed=embed)
         
-        # Clear and re-add reactions
-        await reaction.message.clear_reactions()
-        for i in range(min(len(players), 10)):
-            await reaction.message.add_reaction(NUMBER_EMOJIS[i])
-        for pos_emoji in POSITION_EMOJIS.keys():
-            await reaction.message.add_reaction(pos_emoji)
-        
+        # Diff the reactions instead of clearing and re-adding all 14:
+        # nav emojis never change, number emojis only when the new
+        # position offers fewer/more players
+        new_count = min(len(players), 10)
+        old_count = draft_manager.board_reaction_count
+        tasks = [reaction.remove(user)]
+        if new_count < old_count:
+            tasks += [reaction.message.clear_reaction(NUMBER_EMOJIS[i])
+                      for i in range(new_count, old_count)]
+        elif new_count > old_count:
+            tasks += [reaction.message.add_reaction(NUMBER_EMOJIS[i])
+                      for i in range(old_count, new_count)]
+        draft_manager.board_reaction_count = new_count
+        await asyncio.gather(*tasks)
+
         return
     
     # Handle player selection
-    if emoji in NUMBER_EMOJIS:
-        player_index = NUMBER_EMOJIS.index(emoji)
-        
-        # Get available players
-        available_players = roster_manager.get_top_available(
-            draft_manager.current_position,
-            draft_manager.drafted_players,
-            limit=10
-        )
-        
+    player_index = NUMBER_EMOJI_INDEX.get(emoji)
+    if player_index is not None:
+        # The board snapshot matches the message the user reacted to, so
+        # index it directly instead of recomputing the top-N list
+        available_players = draft_manager.current_board_players
+
         if player_index >= len(available_players):
             await reaction.message.channel.send("❌ Invalid selection!")
             await reaction.remove(user)
             return
         
         selected_player = available_players[player_index]
-        
-        # Make the pick
-        user_id, error = draft_manager.add_pick(
-            selected_player['name'],
-            selected_player['team'],
-            selected_player['position']
-        )
-        
-        if error:
-            await reaction.message.channel.send(f"❌ {error}")
+
+        if not await process_pick(reaction.message.channel, user, selected_player):
             await reaction.remove(user)
-            return
-        
-        # Announce the pick
-        pick_number = len(draft_manager.all_picks)
-        current_round = draft_manager.get_current_round()
-        # Use current_pick before increment to get accurate pick in round
-        pick_in_round = ((draft_manager.current_pick - 1) % len(draft_manager.base_draft_order)) + 1
-        
-        embed = discord.Embed(
-            title=f"✅ Pick #{pick_number} (Round {current_round}, Pick {pick_in_round})",
-            description=f"<@{user.id}> selects:",
-            color=discord.Color.green()
-        )
-        embed.add_field(name="Player", value=selected_player['name'], inline=True)
-        embed.add_field(name="Position", value=selected_player['position'], inline=True)
-        embed.add_field(name="Team", value=selected_player['team'], inline=True)
-        
-        if selected_player.get('headshot'):
-            embed.set_thumbnail(url=selected_player['headshot'])
-        
-        await reaction.message.channel.send(embed=embed)
-        
-        # Check if draft is complete
-        if draft_manager.current_pick >= len(draft_manager.draft_order):
-            await reaction.message.channel.send("🎉 **DRAFT COMPLETE!** Use `!teams` to see all rosters or `!export` to get data for scoring.")
-            draft_manager.is_active = False
-            draft_manager.save_data()
-            return
-        
-        # Show next draft board
-        draft_manager.current_position = 'QB'  # Reset to QB
-        embed, players = await create_draft_board(reaction.message.channel, 'QB')
-        new_message = await reaction.message.channel.send(embed=embed)
-        
-        # Add reactions
-        for i in range(min(len(players), 10)):
-            await new_message.add_reaction(NUMBER_EMOJIS[i])
-        for pos_emoji in POSITION_EMOJIS.keys():
-            await new_message.add_reaction(pos_emoji)
-        
-        draft_manager.current_draft_message = new_message.id
-        
-        # Ping next user
-        next_user_id = draft_manager.get_current_user()
-        next_round = draft_manager.get_current_round()
-        next_pick_in_round = ((draft_manager.current_pick) % len(draft_manager.base_draft_order)) + 1
-        
-        await reaction.message.channel.send(f"🔔 <@{next_user_id}> - You're on the clock! (Round {next_round}, Pick {next_pick_in_round})")
+
+@bot.command(name='pick')
+async def make_pick(ctx, *, query: str):
+    """Draft a player by typing their name instead of using the board
+
+    Usage: !pick Jordan Love
+    Prefix matches work too, e.g. !pick jordan lo
+    """
+    if not draft_manager.is_active:
+        await ctx.send("❌ No active draft!")
+        return
+
+    current_user_id = draft_manager.get_current_user()
+    if str(ctx.author.id) != current_user_id:
+        await ctx.send(f"❌ It's not your turn! <@{current_user_id}> is on the clock.")
+        return
+
+    matches = [p for p in roster_manager.find_players(query.strip())
+               if p.key not in draft_manager.drafted_players]
+
+    if not matches:
+        await ctx.send(f"❌ No available player matching `{query}`!")
+        return
+
+    if len(matches) > 1:
+        options = "\n".join([f"• {p.name} ({p.position} - {p.team})" for p in matches[:10]])
+        await ctx.send(f"❌ Multiple players match `{query}` - be more specific:\n{options}")
+        return
+
+    await process_pick(ctx.channel, ctx.author, matches[0])
 
 @bot.command(name='teams')
 async def show_teams(ctx):
@@ -474,19 +761,26 @@ async def show_teams(ctx):
         await ctx.send("❌ No draft data available!")
         return
     
+    # Batch rosters into as few embeds as Discord allows - a send per
+    # team burns rate limit fast, but one embed caps out at 6000 chars /
+    # 25 fields, which a full 20-round draft blows past
+    char_budget = 5500  # headroom under the 6000-char embed cap
+
+    embeds = []
+    embed = discord.Embed(title="🏈 League Rosters", color=discord.Color.blue())
+    used = len(embed.title)
     for user_id, team_data in draft_manager.teams.items():
-        players_text = "\n".join([
-            f"{i+1}. {p['player_name']} ({p['position']} - {p['player_team']})" 
-            for i, p in enumerate(team_data['players'])
-        ]) or "No picks yet"
-        
-        embed = discord.Embed(
-            title=f"🏈 {team_data['team_name']}",
-            description=f"**Manager:** <@{user_id}>\n\n{players_text}",
-            color=discord.Color.blue()
-        )
-        embed.set_footer(text=f"{len(team_data['players'])} players")
-        
+        name = f"{team_data['team_name']} ({len(team_data['players'])} players)"
+        value = f"**Manager:** <@{user_id}>\n{draft_manager.get_roster_text(user_id)}"
+        if len(embed.fields) >= 25 or used + len(name) + len(value) > char_budget:
+            embeds.append(embed)
+            embed = discord.Embed(title="🏈 League Rosters (cont.)", color=discord.Color.blue())
+            used = len(embed.title)
+        embed.add_field(name=name, value=value, inline=False)
+        used += len(name) + len(value)
+    embeds.append(embed)
+
+    for embed in embeds:
         await ctx.send(embed=embed)
 
 @bot.command(name='myteam')
@@ -499,20 +793,23 @@ async def show_my_team(ctx):
         return
     
     team_data = draft_manager.teams[user_id]
-    players_text = "\n".join([
-        f"{i+1}. {p['player_name']} ({p['position']} - {p['player_team']})" 
-        for i, p in enumerate(team_data['players'])
-    ]) or "No picks yet"
-    
+
     embed = discord.Embed(
         title=f"🏈 {team_data['team_name']}",
-        description=players_text,
+        description=draft_manager.get_roster_text(user_id),
         color=discord.Color.blue()
     )
     embed.set_footer(text=f"{len(team_data['players'])} players")
     
     await ctx.send(embed=embed)
 
+def _write_export(export_data):
+    """Serialize and atomically write the export file (blocking)"""
+    # Temp file + atomic rename so a crash mid-write can't tear the export
+    with open('draft_export.json.tmp', 'wb') as f:
+        f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
+    os.replace('draft_export.json.tmp', 'draft_export.json')
+
 @bot.command(name='export')
 async def export_data(ctx):
     """Export draft data as JSON for scoring"""
@@ -520,23 +817,24 @@ async def export_data(ctx):
         await ctx.send("❌ No draft data available!")
         return
     
+    # Single pass over the already-grouped pick lists; the player lists
+    # are referenced, not copied, so nothing per-pick is rebuilt here
     export_data = {
         'draft_date': datetime.now().isoformat(),
-        'teams': []
+        'teams': [
+            {
+                'team_name': team_data['team_name'],
+                'user_id': user_id,
+                'players': team_data['players']
+            }
+            for user_id, team_data in draft_manager.teams.items()
+        ]
     }
-    
-    for user_id, team_data in draft_manager.teams.items():
-        export_data['teams'].append({
-            'team_name': team_data['team_name'],
-            'user_id': user_id,
-            'players': team_data['players']
-        })
-    
-    json_str = json.dumps(export_data, indent=2)
-    
-    with open('draft_export.json', 'w') as f:
-        f.write(json_str)
-    
+
+    # Serialization + disk write happen on a worker thread so a large
+    # draft doesn't stall the event loop mid-command
+    await asyncio.to_thread(_write_export, export_data)
+
     await ctx.send("📤 Draft data exported!", file=discord.File('draft_export.json'))
 
 
@@ -555,7 +853,7 @@ async def undo_pick(ctx):
     last_pick = draft_manager.all_picks[-1]
     
     # Undo the pick
-    success = draft_manager.undo_last_pick()
+    success = await draft_manager.undo_last_pick()
     
     if success:
         await ctx.send(f"↩️ **Undone:** {last_pick['player_name']} ({last_pick['position']}, {last_pick['player_team']}) - Pick #{last_pick['pick_number']}")
@@ -580,22 +878,17 @@ async def best_available(ctx, limit: int = 20):
         await ctx.send("❌ Please choose a number between 1 and 50")
         return
     
-    # Gather all available players from all positions
-    all_available = []
-    
-    for position in ['QB', 'RB', 'WR', 'TE']:
-        available = roster_manager.get_top_available(
-            position,
-            draft_manager.drafted_players,
-            limit=100  # Get many to sort across positions
-        )
-        all_available.extend(available)
-    
-    # Sort by fantasy rank
-    all_available.sort(key=lambda x: x.get('fantasy_rank', 999))
-    
+    # The per-position lists are already rank-sorted at load time, so a
+    # lazy merge replaces re-sorting every available player per call
+    merged = heapq.merge(
+        *(roster_manager.get_top_available(position, limit=100,
+                                           version=draft_manager.cache_version)
+          for position in POSITIONS),
+        key=lambda x: x.fantasy_rank
+    )
+
     # Take top N
-    top_players = all_available[:limit]
+    top_players = list(itertools.islice(merged, limit))
     
     if not top_players:
         await ctx.send("❌ No players available!")
@@ -610,18 +903,18 @@ async def best_available(ctx, limit: int = 20):
     # Group by position for cleaner display
     by_position = {}
     for player in top_players:
-        pos = player['position']
+        pos = player.position
         if pos not in by_position:
             by_position[pos] = []
         by_position[pos].append(player)
     
     # Add fields by position
-    for pos in ['QB', 'RB', 'WR', 'TE']:
+    for pos in POSITIONS:
         if pos in by_position:
             players_list = by_position[pos]
             # Format: "Name (TEAM) - Rank #"
             players_text = "\n".join([
-                f"**{p['name']}** ({p['team']}) - Rank {p['fantasy_rank']}"
+                f"**{p.name}** ({p.team}) - Rank {p.fantasy_rank}"
                 for p in players_list
             ])
             embed.add_field(